@@ -1,13 +1,260 @@
-from flask import Flask, render_template, request, redirect, url_for, flash, jsonify
+from flask import Flask, render_template, request, redirect, url_for, flash, jsonify, g, current_app, session, abort
 from flask_sqlalchemy import SQLAlchemy
+from flask_caching import Cache
 from flask_login import LoginManager, login_user, logout_user, login_required, current_user, UserMixin
-from werkzeug.security import generate_password_hash, check_password_hash
-from datetime import datetime, timedelta
+from sqlalchemy import delete, event, func, insert, inspect, lambda_stmt, select, text, tuple_, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError, OperationalError
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import joinedload, selectinload, raiseload
+from werkzeug.security import check_password_hash
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+from pydantic import BaseModel, ValidationError, field_validator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from types import SimpleNamespace
+from typing import Optional
+import click
+import csv
+import functools
+import hmac
 import os
+import sqlite3
+import threading
+import uuid
 
 BASE_DIR = os.path.abspath(os.path.dirname(__file__))
 
+# Flash messages
+MSG_ADMIN_ONLY = '❌ Admin access only.'
+MSG_BOOKING_NOT_FOUND = 'Booking request not found.'
+MSG_BOOKING_REJECTED = '❌ Booking request rejected.'
+MSG_PURGE_FAILED = '❌ Error purging rejected requests.'
+MSG_BOOKING_SUBMITTED = '✅ Booking request submitted! An admin will review your request soon.'
+MSG_SIGNUP_FIELDS_REQUIRED = 'Username, email, and password are required.'
+MSG_PASSWORDS_MISMATCH = 'Passwords do not match.'
+MSG_PASSWORD_TOO_SHORT = 'Password must be at least 6 characters.'
+MSG_USERNAME_TAKEN = 'Username already exists.'
+MSG_EMAIL_REGISTERED = 'Email already registered.'
+MSG_ACCOUNT_CREATED = 'Account created! Please log in.'
+MSG_TENANT_LOGGED_IN = 'Logged in as tenant.'
+MSG_INVALID_CREDENTIALS = 'Invalid credentials.'
+MSG_LOGGED_OUT = 'Logged out.'
+MSG_LOGGED_IN = 'Logged in.'
+MSG_CURRENT_PASSWORD_WRONG = 'Current password is incorrect.'
+MSG_NEW_PASSWORDS_MISMATCH = 'New passwords do not match.'
+MSG_NEW_PASSWORD_TOO_SHORT = 'New password must be at least 6 characters.'
+MSG_PASSWORD_CHANGED = 'Password changed successfully.'
+MSG_MAINTENANCE_CREATED = 'Maintenance request created.'
+MSG_MAINTENANCE_UPDATED = 'Maintenance request updated.'
+MSG_MAINTENANCE_DELETED = '✅ Maintenance request deleted successfully.'
+MSG_CONTACT_ADDED = 'Emergency contact added.'
+MSG_CONTACT_UPDATED = 'Emergency contact updated.'
+MSG_CONTACT_DELETED = 'Emergency contact deleted.'
+MSG_TENANT_EMAIL_TAKEN = 'A tenant with that email already exists.'
+MSG_TENANT_CREATED = 'Tenant created.'
+MSG_TENANT_UPDATED = 'Tenant updated.'
+MSG_TENANT_DELETED = '✅ Tenant deleted successfully.'
+MSG_INVALID_LEASE = 'Invalid lease details.'
+MSG_LEASE_CREATED = 'Lease created.'
+MSG_LEASE_UPDATED = 'Lease updated.'
+MSG_LEASE_DELETED = '✅ Lease deleted.'
+MSG_INVALID_PAYMENT = 'Invalid payment details.'
+MSG_PAYMENT_LOGGED = 'Payment logged.'
+
+BOOKING_REQUESTS_PAGE_SIZE = 50
+PAYMENTS_PAGE_SIZE = 50
+
 db = SQLAlchemy()
+cache = Cache()
+
+# Trigram FTS5 index over emergency contacts, kept in sync with the base table by triggers.
+# The trigram tokenizer matches arbitrary substrings, preserving the old LIKE '%q%' semantics.
+EMERGENCY_CONTACT_FTS_DDL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS emergency_contact_fts USING fts5("
+    "unit_identifier, name, phone, content='emergency_contact', content_rowid='id', tokenize='trigram')",
+    "CREATE TRIGGER IF NOT EXISTS emergency_contact_ai AFTER INSERT ON emergency_contact BEGIN "
+    "INSERT INTO emergency_contact_fts(rowid, unit_identifier, name, phone) "
+    "VALUES (new.id, new.unit_identifier, new.name, new.phone); END",
+    "CREATE TRIGGER IF NOT EXISTS emergency_contact_ad AFTER DELETE ON emergency_contact BEGIN "
+    "INSERT INTO emergency_contact_fts(emergency_contact_fts, rowid, unit_identifier, name, phone) "
+    "VALUES ('delete', old.id, old.unit_identifier, old.name, old.phone); END",
+    "CREATE TRIGGER IF NOT EXISTS emergency_contact_au AFTER UPDATE ON emergency_contact BEGIN "
+    "INSERT INTO emergency_contact_fts(emergency_contact_fts, rowid, unit_identifier, name, phone) "
+    "VALUES ('delete', old.id, old.unit_identifier, old.name, old.phone); "
+    "INSERT INTO emergency_contact_fts(rowid, unit_identifier, name, phone) "
+    "VALUES (new.id, new.unit_identifier, new.name, new.phone); END",
+    "INSERT INTO emergency_contact_fts(emergency_contact_fts) VALUES ('rebuild')",
+)
+
+EMERGENCY_CONTACT_FTS_SEARCH = text(
+    "SELECT ec.* FROM emergency_contact ec "
+    "JOIN emergency_contact_fts f ON f.rowid = ec.id "
+    "WHERE emergency_contact_fts MATCH :q ORDER BY f.rank"
+)
+
+
+@event.listens_for(Engine, 'connect')
+def _set_sqlite_pragmas(dbapi_conn, _record):
+    """Apply WAL journaling and cache/mmap tuning to every new SQLite connection."""
+    if not isinstance(dbapi_conn, sqlite3.Connection):
+        return
+    cur = dbapi_conn.cursor()
+    cur.execute('PRAGMA journal_mode=WAL')
+    cur.execute('PRAGMA synchronous=NORMAL')
+    cur.execute('PRAGMA temp_store=MEMORY')
+    cur.execute('PRAGMA cache_size=-64000')
+    cur.execute('PRAGMA mmap_size=268435456')
+    cur.close()
+
+
+# argon2id at the OWASP-recommended profile (46 MiB, t=2, p=1)
+password_hasher = PasswordHasher(time_cost=2, memory_cost=47104, parallelism=1)
+
+# KDF work runs here: argon2 releases the GIL, so other request threads keep serving,
+# and at most one 46 MiB hash per core is in flight no matter how many logins arrive.
+HASH_POOL = ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix='password-hash')
+
+
+def hash_password(password):
+    return HASH_POOL.submit(password_hasher.hash, password).result()
+
+
+def verify_password(password_hash, password):
+    """Verify `password` against a stored hash.
+    Returns (ok, new_hash); new_hash is set when the stored hash should be upgraded,
+    which covers legacy Werkzeug pbkdf2/scrypt hashes and outdated argon2 parameters."""
+    if not password_hash or password is None:
+        return False, None
+    if not password_hash.startswith('$argon2'):
+        if HASH_POOL.submit(check_password_hash, password_hash, password).result():
+            return True, hash_password(password)
+        return False, None
+    try:
+        HASH_POOL.submit(password_hasher.verify, password_hash, password).result()
+    except (VerificationError, InvalidHashError):
+        return False, None
+    if password_hasher.check_needs_rehash(password_hash):
+        return True, hash_password(password)
+    return True, None
+
+
+@functools.cache
+def dummy_password_hash():
+    """argon2 hash of a random password. Logins for a missing account are verified against it,
+    so they spend the same KDF time as a wrong password and do not reveal the account is absent."""
+    return hash_password(os.urandom(16).hex())
+
+
+# Verify-password cache: HMAC(pepper, owner + password + stored hash) -> (owner, ok).
+# The pepper is per-process, so plaintext passwords are never recoverable from the keys.
+_VERIFY_CACHE_SIZE = 1024
+_verify_cache = {}
+_verify_cache_lock = threading.Lock()
+_verify_cache_pepper = os.urandom(32)
+
+
+def _verify_cache_key(owner, password_hash, password):
+    msg = b'\0'.join((owner.encode(), password.encode(), (password_hash or '').encode()))
+    return hmac.new(_verify_cache_pepper, msg, 'sha256').digest()
+
+
+def invalidate_verify_cache(owner):
+    """Drop every cached verification result for `owner`."""
+    with _verify_cache_lock:
+        for key in [k for k, v in _verify_cache.items() if v[0] == owner]:
+            del _verify_cache[key]
+
+
+def check_user_password(user, password):
+    """Verify `password` for an account, upgrading its stored hash when needed.
+    Results are memoised when USE_VERIFY_PASSWORD_CACHE is enabled."""
+    use_cache = password is not None and current_app.config.get('USE_VERIFY_PASSWORD_CACHE')
+    if use_cache:
+        owner = user.password_owner()
+        key = _verify_cache_key(owner, user.password_hash, password)
+        with _verify_cache_lock:
+            hit = _verify_cache.get(key)
+        if hit is not None:
+            return hit[1]
+    ok, new_hash = verify_password(user.password_hash, password)
+    if new_hash:
+        user.password_hash = new_hash
+        db.session.commit()
+    if use_cache:
+        key = _verify_cache_key(owner, user.password_hash, password)
+        with _verify_cache_lock:
+            while len(_verify_cache) >= _VERIFY_CACHE_SIZE:
+                _verify_cache.pop(next(iter(_verify_cache)))
+            _verify_cache[key] = (owner, ok)
+    return ok
+
+
+def is_admin_user(user=None):
+    """True when `user` (default: the current user) is an admin account."""
+    return getattr(current_user if user is None else user, 'is_admin', False)
+
+
+class LeaseIn(BaseModel):
+    """Validated lease form submission."""
+    unit_id: int
+    tenant_id: int
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
+    monthly_rent: Decimal = Decimal(0)
+
+    @field_validator('start_date', 'end_date', mode='before')
+    @classmethod
+    def _blank_date(cls, value):
+        return value or None
+
+    @field_validator('monthly_rent', mode='before')
+    @classmethod
+    def _blank_rent(cls, value):
+        return value or 0
+
+
+class PaymentIn(BaseModel):
+    """Validated payment form submission."""
+    lease_id: int
+    amount: Decimal
+
+    @field_validator('amount', mode='before')
+    @classmethod
+    def _blank_amount(cls, value):
+        return value or 0
+
+
+# Paths of argument-free endpoints, resolved once when create_app() finishes
+# registering routes so redirects skip the URL map walk in url_for().
+REDIRECTS = {}
+
+
+def redirect_to(endpoint):
+    """redirect() to an argument-free endpoint using its precomputed path."""
+    return redirect(request.script_root + REDIRECTS[endpoint])
+
+
+def admin_required(f):
+    """Like login_required, but also redirects non-admin accounts to the dashboard."""
+    @functools.wraps(f)
+    @login_required
+    def wrapper(*args, **kwargs):
+        if not getattr(current_user, 'is_admin', False):
+            flash(MSG_ADMIN_ONLY, 'error')
+            return redirect_to('dashboard')
+        return f(*args, **kwargs)
+    return wrapper
+
+
+def is_tenant_user(user=None):
+    """True when `user` (default: the current user) is a tenant account."""
+    u = current_user if user is None else user
+    gid = u.get_id() if getattr(u, 'is_authenticated', False) else None
+    return isinstance(gid, str) and gid.startswith('tenant_')
+
 
 def create_app(test_config=None):
     """Initialize and configure the Flask application with database and authentication."""
@@ -24,39 +271,65 @@ def create_app(test_config=None):
         SECRET_KEY='dev',
         SQLALCHEMY_DATABASE_URI=f"sqlite:///{db_file}",
         SQLALCHEMY_TRACK_MODIFICATIONS=False,
+        RAISELOAD=os.environ.get('RAISELOAD') == '1',
+        USE_VERIFY_PASSWORD_CACHE=os.environ.get('USE_VERIFY_PASSWORD_CACHE', '1') == '1',
+        CACHE_TYPE=os.environ.get('CACHE_TYPE', 'SimpleCache'),
+        CACHE_DIR=os.environ.get('CACHE_DIR'),
+        CACHE_REDIS_URL=os.environ.get('CACHE_REDIS_URL'),
+        CACHE_DEFAULT_TIMEOUT=60,
     )
 
     if test_config:
         app.config.update(test_config)
 
+    uri = app.config['SQLALCHEMY_DATABASE_URI']
+    if uri.startswith('sqlite:///') and ':memory:' not in uri:
+        # File-backed SQLite: reuse pooled connections across requests.
+        app.config.setdefault('SQLALCHEMY_ENGINE_OPTIONS', {
+            'pool_size': 5,
+            'max_overflow': 10,
+            'pool_pre_ping': True,
+            'connect_args': {'check_same_thread': False, 'timeout': 30},
+        })
+    # Room for every hot statement's compiled form, so steady-state requests never recompile.
+    engine_options = dict(app.config.get('SQLALCHEMY_ENGINE_OPTIONS') or {})
+    engine_options.setdefault('query_cache_size', 1200)
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = engine_options
+
     try:
         os.makedirs(app.instance_path, exist_ok=True)
     except OSError:
         pass
 
     db.init_app(app)
+    cache.init_app(app)
+
+    def raiseload_enabled():
+        return bool(app.config.get('RAISELOAD') or app.debug)
+
+    def strict(*options):
+        """Append raiseload('*') in debug/RAISELOAD mode so unplanned lazy loads fail loudly."""
+        if raiseload_enabled():
+            return options + (raiseload('*'),)
+        return options
+
+    if app.config.get('RAISELOAD'):
+        # Count statements per request so N+1 regressions show up in the log.
+        with app.app_context():
+            @event.listens_for(db.engine, 'before_cursor_execute')
+            def _count_statements(conn, cursor, statement, parameters, context, executemany):
+                if g:
+                    g._statement_count = g.get('_statement_count', 0) + 1
+
+        @app.after_request
+        def _log_statement_count(response):
+            app.logger.debug('%s %s issued %d SQL statement(s)',
+                             request.method, request.path, g.get('_statement_count', 0))
+            return response
     login_manager = LoginManager()
     login_manager.login_view = 'login'
     login_manager.init_app(app)
 
-    def is_admin_user(user=None):
-        from flask_login import current_user as _current
-        u = user or _current
-        try:
-            gid = u.get_id()
-            return isinstance(gid, str) and gid.startswith('user_')
-        except Exception:
-            return False
-
-    def is_tenant_user(user=None):
-        from flask_login import current_user as _current
-        u = user or _current
-        try:
-            gid = u.get_id()
-            return isinstance(gid, str) and gid.startswith('tenant_')
-        except Exception:
-            return False
-
     @app.context_processor
     def inject_user_flags():
         return dict(is_admin=is_admin_user(), is_tenant=is_tenant_user())
@@ -64,28 +337,27 @@ def create_app(test_config=None):
     @login_manager.user_loader
     def load_user(user_id):
         """Load user from session. Handles both admin (User) and tenant (TenantUser) accounts.
-        Uses prefixed IDs (user_<id>, tenant_<id>) to avoid collisions between tables."""
-        try:
-            if isinstance(user_id, str) and '_' in user_id:
-                prefix, uid = user_id.split('_', 1)
-                uid = int(uid)
-                if prefix == 'user':
-                    return User.query.get(uid)
-                if prefix == 'tenant':
-                    return TenantUser.query.get(uid)
-        except Exception:
-            pass
+        Uses prefixed IDs (user_<id>, tenant_<id>) to avoid collisions between tables.
+        The resolved user is cached on `g` so repeated lookups within a request skip the database."""
+        cached = g.get('_cached_user')
+        if cached is not None and cached[0] == user_id:
+            return cached[1]
+        user = None
         try:
-            uid = int(user_id)
+            prefix, uid = user_id.split('_', 1)
+            uid = int(uid)
+            if prefix == 'user':
+                user = db.session.get(User, uid)
+            elif prefix == 'tenant':
+                user = db.session.get(TenantUser, uid)
         except Exception:
-            return None
-        user = User.query.get(uid)
-        if user:
-            return user
-        return TenantUser.query.get(uid)
+            user = None
+        g._cached_user = (user_id, user)
+        return user
 
     class User(db.Model, UserMixin):
         """Admin user account for property management."""
+        is_admin = True
         id = db.Column(db.Integer, primary_key=True)
         username = db.Column(db.String(80), unique=True, nullable=False)
         password_hash = db.Column(db.String(200), nullable=False)
@@ -94,81 +366,102 @@ def create_app(test_config=None):
             """Return prefixed user ID for session storage."""
             return f'user_{self.id}'
 
+        def password_owner(self):
+            return f'user:{self.username}'
+
         def set_password(self, password):
-            self.password_hash = generate_password_hash(password)
+            self.password_hash = hash_password(password)
+            invalidate_verify_cache(self.password_owner())
 
         def check_password(self, password):
-            return check_password_hash(self.password_hash, password)
+            return check_user_password(self, password)
 
     class TenantUser(db.Model, UserMixin):
         """Tenant account for apartment booking and lease management."""
+        is_admin = False
         id = db.Column(db.Integer, primary_key=True)
         username = db.Column(db.String(80), unique=True, nullable=False)
         email = db.Column(db.String(120), unique=True, nullable=False)
         password_hash = db.Column(db.String(200), nullable=False)
         phone = db.Column(db.String(50))
-        created_at = db.Column(db.DateTime, default=datetime.utcnow)
+        created_at = db.Column(db.DateTime, default=db.func.current_timestamp())
+        lease_requests = db.relationship('LeaseRequest', back_populates='tenant_user')
 
         def get_id(self):
             """Return prefixed tenant ID for session storage."""
             return f'tenant_{self.id}'
 
+        def password_owner(self):
+            return f'tenant:{self.username}'
+
         def set_password(self, password):
-            self.password_hash = generate_password_hash(password)
+            self.password_hash = hash_password(password)
+            invalidate_verify_cache(self.password_owner())
 
         def check_password(self, password):
-            return check_password_hash(self.password_hash, password)
+            return check_user_password(self, password)
 
     class Property(db.Model):
         """Rental property (complex/building)."""
         id = db.Column(db.Integer, primary_key=True)
         name = db.Column(db.String(120), nullable=False)
         address = db.Column(db.String(255))
-        units = db.relationship('Unit', backref='property', lazy=True)
+        units = db.relationship('Unit', back_populates='property')
 
     class Unit(db.Model):
         """Individual apartment/room within a property. Status: 'vacant' or 'occupied'."""
         id = db.Column(db.Integer, primary_key=True)
-        number = db.Column(db.String(50), nullable=False)
+        number = db.Column(db.String(50), nullable=False, index=True)
         status = db.Column(db.String(30), default='vacant')
         property_id = db.Column(db.Integer, db.ForeignKey('property.id'))
-        leases = db.relationship('Lease', backref='unit', lazy=True)
+        property = db.relationship('Property', back_populates='units')
+        leases = db.relationship('Lease', back_populates='unit')
+        lease_requests = db.relationship('LeaseRequest', back_populates='unit')
+        emergency_contacts = db.relationship('EmergencyContact', back_populates='unit')
 
     class Tenant(db.Model):
         """Tenant record linked to active leases (created from booking approvals)."""
+        __table_args__ = (db.Index('uq_tenant_email', 'email', unique=True),)
         id = db.Column(db.Integer, primary_key=True)
         name = db.Column(db.String(120), nullable=False)
         phone = db.Column(db.String(50))
         email = db.Column(db.String(120))
-        leases = db.relationship('Lease', backref='tenant', lazy=True)
+        leases = db.relationship('Lease', back_populates='tenant')
 
     class Lease(db.Model):
         """Active or completed lease agreement between a tenant and unit."""
         id = db.Column(db.Integer, primary_key=True)
-        unit_id = db.Column(db.Integer, db.ForeignKey('unit.id'))
+        unit_id = db.Column(db.Integer, db.ForeignKey('unit.id'), index=True)
         tenant_id = db.Column(db.Integer, db.ForeignKey('tenant.id'))
         start_date = db.Column(db.Date)
-        end_date = db.Column(db.Date)
+        end_date = db.Column(db.Date, index=True)
         monthly_rent = db.Column(db.Float)
-        payments = db.relationship('Payment', backref='lease', lazy=True)
+        unit = db.relationship('Unit', back_populates='leases')
+        tenant = db.relationship('Tenant', back_populates='leases')
+        payments = db.relationship('Payment', back_populates='lease')
 
     class Payment(db.Model):
         """Payment record for a lease (rent payment tracking)."""
+        # covers the payments list: newest first, every rendered column in the index
+        __table_args__ = (db.Index('ix_payments_date_desc', db.text('date DESC'), db.text('id DESC'),
+                                   'lease_id', 'amount'),)
         id = db.Column(db.Integer, primary_key=True)
         lease_id = db.Column(db.Integer, db.ForeignKey('lease.id'))
         amount = db.Column(db.Float, nullable=False)
-        date = db.Column(db.DateTime, default=datetime.utcnow)
+        date = db.Column(db.DateTime, default=db.func.current_timestamp())
+        lease = db.relationship('Lease', back_populates='payments')
 
     class MaintenanceRequest(db.Model):
         """Maintenance issue report for a unit. Status: 'open', 'in_progress', 'completed'."""
         id = db.Column(db.Integer, primary_key=True)
         unit_id = db.Column(db.Integer)
         description = db.Column(db.Text)
-        status = db.Column(db.String(50), default='open')
-        created_at = db.Column(db.DateTime, default=datetime.utcnow)
+        status = db.Column(db.String(50), default='open', index=True)
+        created_at = db.Column(db.DateTime, default=db.func.current_timestamp(), index=True)
 
     class LeaseRequest(db.Model):
         """Booking request from a tenant. Status: 'pending', 'approved', 'rejected'."""
+        __table_args__ = (db.Index('ix_leasereq_status_created', 'status', 'created_at'),)
         id = db.Column(db.Integer, primary_key=True)
         unit_id = db.Column(db.Integer, db.ForeignKey('unit.id'))
         tenant_user_id = db.Column(db.Integer, db.ForeignKey('tenant_user.id'))
@@ -176,23 +469,74 @@ def create_app(test_config=None):
         end_date = db.Column(db.Date)
         notes = db.Column(db.Text)
         status = db.Column(db.String(50), default='pending')
-        created_at = db.Column(db.DateTime, default=datetime.utcnow)
-        unit = db.relationship('Unit', backref='lease_requests')
-        tenant_user = db.relationship('TenantUser', backref='lease_requests')
+        # stamped in Python, not by SQLite: CURRENT_TIMESTAMP stores no microseconds, so the stored
+        # text would sort below the bound keyset cursor and the booking list would repeat rows
+        created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False, index=True)
+        unit = db.relationship('Unit', back_populates='lease_requests')
+        tenant_user = db.relationship('TenantUser', back_populates='lease_requests')
 
     class EmergencyContact(db.Model):
         """Emergency contact information per unit for public lookup."""
         id = db.Column(db.Integer, primary_key=True)
-        unit_identifier = db.Column(db.String(100))
+        unit_id = db.Column(db.Integer, db.ForeignKey('unit.id'), index=True)
+        unit_identifier = db.Column(db.String(100), index=True)
         name = db.Column(db.String(120))
         phone = db.Column(db.String(50))
-    
+        unit = db.relationship('Unit', back_populates='emergency_contacts')
+
+    def unit_id_for(identifier):
+        """Resolve a free-form unit identifier (e.g. 'Room 1') to a Unit id, or None."""
+        if not identifier:
+            return None
+        return db.session.execute(select(Unit.id).where(Unit.number == identifier).limit(1)).scalar()
 
     @app.cli.command('init-db')
     def init_db():
         """Initialize database schema and seed default data (properties, units, users)."""
         print(f"Using database URI: {app.config.get('SQLALCHEMY_DATABASE_URI')}")
         db.create_all()
+        # older databases predate emergency_contact.unit_id: add it and link rows by unit number
+        if 'unit_id' not in {c['name'] for c in inspect(db.engine).get_columns('emergency_contact')}:
+            db.session.execute(text('ALTER TABLE emergency_contact ADD COLUMN unit_id INTEGER REFERENCES unit(id)'))
+        db.session.execute(text(
+            'UPDATE emergency_contact SET unit_id = '
+            '(SELECT unit.id FROM unit WHERE unit.number = emergency_contact.unit_identifier) '
+            'WHERE unit_id IS NULL'
+        ))
+        # rows stamped by CURRENT_TIMESTAMP lack the microseconds SQLAlchemy writes; pad them so
+        # every created_at compares consistently against the booking list's keyset cursor
+        db.session.execute(text(
+            "UPDATE lease_request SET created_at = created_at || '.000000' WHERE length(created_at) = 19"
+        ))
+        # the keyset cursor cannot step past NULL stamps; date unstamped rows to the epoch, where
+        # the newest-first order already put them
+        db.session.execute(text(
+            "UPDATE lease_request SET created_at = '1970-01-01 00:00:00.000000' WHERE created_at IS NULL"
+        ))
+        # older tenant forms stored a blank email as '', which uq_tenant_email would reject twice over
+        db.session.execute(update(Tenant).where(Tenant.email == '').values(email=None))
+        db.session.commit()
+        duplicate_emails = db.session.execute(
+            select(Tenant.email).where(Tenant.email.is_not(None)).group_by(Tenant.email).having(func.count() > 1)
+        ).scalars().all()
+        if duplicate_emails:
+            print(f"Tenant emails used more than once: {', '.join(duplicate_emails)}. "
+                  'Merge or correct those tenants, then rerun init-db to create uq_tenant_email.')
+        # create_all() skips existing tables, so add any indexes they are missing
+        for table in db.metadata.sorted_tables:
+            for index in table.indexes:
+                if index.name == 'uq_tenant_email' and duplicate_emails:
+                    continue
+                index.create(db.engine, checkfirst=True)
+        try:
+            for stmt in EMERGENCY_CONTACT_FTS_DDL:
+                db.session.execute(text(stmt))
+            db.session.commit()
+        except OperationalError:
+            db.session.rollback()
+            print('FTS5 unavailable; emergency lookup will use LIKE search.')
+        # Seed everything in one transaction: flush() assigns ids without an fsync,
+        # and the single commit at the end is the only write to disk.
         if not Property.query.first():
             props = [
                 Property(name='Greenfield Heights', address='123 Main St'),
@@ -200,86 +544,71 @@ def create_app(test_config=None):
                 Property(name='Urban Plaza Apts', address='789 Pine Blvd'),
                 Property(name='Riverside Towers', address='321 Elm Way')
             ]
-            for p in props:
-                db.session.add(p)
-            db.session.commit()
-            
-            units = []
-            for i, p in enumerate(props, 1):
-                u = Unit(number=f'Room {i}', status='vacant', property_id=p.id)
-                db.session.add(u)
-                units.append(u)
-            db.session.commit()
-            
+            units = [Unit(number=f'Room {i}', status='vacant', property=p) for i, p in enumerate(props, 1)]
             tenants = [
                 Tenant(name='Juan Dela Cruz', phone='09171234567', email='juan@example.com'),
                 Tenant(name='Maria Santos', phone='09187654321', email='maria@example.com')
             ]
-            for t in tenants:
-                db.session.add(t)
-            db.session.commit()
-            
+            db.session.add_all(props + units + tenants)
+            db.session.flush()
+
+            today = datetime.utcnow().date()
             units[0].status = 'occupied'
-            lease1 = Lease(
-                unit_id=units[0].id,
-                tenant_id=tenants[0].id,
-                start_date=datetime.utcnow().date(),
-                end_date=(datetime.utcnow() + timedelta(days=365)).date(),
-                monthly_rent=5000
-            )
-            db.session.add(lease1)
-            
             units[3].status = 'occupied'
-            lease2 = Lease(
-                unit_id=units[3].id,
-                tenant_id=tenants[1].id,
-                start_date=datetime.utcnow().date(),
-                end_date=(datetime.utcnow() + timedelta(days=365)).date(),
-                monthly_rent=6500
-            )
-            db.session.add(lease2)
-            db.session.commit()
-            
+            seeds = [
+                Lease(
+                    unit_id=units[0].id,
+                    tenant_id=tenants[0].id,
+                    start_date=today,
+                    end_date=today + timedelta(days=365),
+                    monthly_rent=5000
+                ),
+                Lease(
+                    unit_id=units[3].id,
+                    tenant_id=tenants[1].id,
+                    start_date=today,
+                    end_date=today + timedelta(days=365),
+                    monthly_rent=6500
+                ),
+            ]
+
             for i, u in enumerate(units, 1):
                 if i == 1 and tenants:
-                    ec = EmergencyContact(
+                    seeds.append(EmergencyContact(
+                        unit_id=u.id,
                         unit_identifier=f'Room {i}',
                         name=tenants[0].name,
                         phone=tenants[0].phone
-                    )
+                    ))
                 else:
-                    ec = EmergencyContact(
+                    seeds.append(EmergencyContact(
+                        unit_id=u.id,
                         unit_identifier=f'Room {i}',
                         name=f'Property Manager {i}',
                         phone=f'0917123456{i}'
-                    )
-                db.session.add(ec)
-            db.session.commit()
+                    ))
+
+            if len(units) >= 4:
+                seeds.append(MaintenanceRequest(
+                    unit_id=units[3].id,
+                    description='Leaky faucet reported in Room 4. Needs plumbing attention.',
+                    status='open'
+                ))
+            db.session.add_all(seeds)
 
-            try:
-                if len(units) >= 4:
-                    mr = MaintenanceRequest(
-                        unit_id=units[3].id,
-                        description='Leaky faucet reported in Room 4. Needs plumbing attention.',
-                        status='open'
-                    )
-                    db.session.add(mr)
-                    db.session.commit()
-            except Exception:
-                db.session.rollback()
-        
         if not User.query.filter_by(username='admin').first():
             admin = User(username='admin')
             admin.set_password('admin1234')
             db.session.add(admin)
-            db.session.commit()
-        
+
         if not TenantUser.query.filter_by(username='tenant').first():
             tenant_user = TenantUser(username='tenant', email='tenant@example.com')
             tenant_user.set_password('tenant123')
             db.session.add(tenant_user)
-            db.session.commit()
-        
+
+        db.session.commit()
+        invalidate_dashboard()
+        invalidate_lists('tenants', 'leases', 'payments', 'units')
         print('Initialized the database.')
 
     @app.route('/')
@@ -287,21 +616,42 @@ def create_app(test_config=None):
         return render_template('index.html')
 
     @app.route('/manage')
-    @login_required
+    @admin_required
     def manage():
-        if not is_admin_user():
-            flash('Admin access only.', 'error')
-            return redirect(url_for('dashboard'))
         return render_template('manage.html')
 
+    # Built once; lambda_stmt caches the compiled SQL so each visit only binds parameters.
+    # One extra row is fetched to tell whether an older page exists.
+    booking_requests_stmt = lambda_stmt(lambda: select(LeaseRequest)
+                                        .where(LeaseRequest.status != 'rejected')
+                                        .order_by(LeaseRequest.created_at.desc(), LeaseRequest.id.desc())
+                                        .limit(BOOKING_REQUESTS_PAGE_SIZE + 1)
+                                        .options(selectinload(LeaseRequest.unit),
+                                                 selectinload(LeaseRequest.tenant_user)))
+
     @app.route('/booking-requests')
-    @login_required
+    @admin_required
     def booking_requests():
-        if not is_admin_user():
-            flash('Admin access only.', 'error')
-            return redirect(url_for('dashboard'))
-        requests_data = LeaseRequest.query.filter(LeaseRequest.status != 'rejected').order_by(LeaseRequest.created_at.desc()).all()
-        return render_template('booking_requests.html', requests_data=requests_data)
+        """List non-rejected booking requests, newest first, using keyset pagination.
+        `after`/`after_id` carry the (created_at, id) of the last row on the previous page."""
+        stmt = booking_requests_stmt
+        try:
+            after_ts = datetime.fromisoformat(request.args['after'])
+            after_id = int(request.args['after_id'])
+        except (KeyError, ValueError):
+            pass
+        else:
+            stmt = stmt + (lambda s: s.where(
+                tuple_(LeaseRequest.created_at, LeaseRequest.id) < tuple_(after_ts, after_id)))
+        if raiseload_enabled():
+            stmt = stmt + (lambda s: s.options(raiseload('*')))
+        requests_data = db.session.execute(stmt).scalars().all()
+        next_page = None
+        if len(requests_data) > BOOKING_REQUESTS_PAGE_SIZE:
+            requests_data = requests_data[:BOOKING_REQUESTS_PAGE_SIZE]
+            last = requests_data[-1]
+            next_page = {'after': last.created_at.isoformat(), 'after_id': last.id}
+        return render_template('booking_requests.html', requests_data=requests_data, next_page=next_page)
 
     @app.route('/booking-request/<int:request_id>/approve', methods=['POST'])
     @login_required
@@ -309,21 +659,37 @@ def create_app(test_config=None):
         if not is_admin_user():
             return jsonify({'ok': False, 'message': 'Admin access only'}), 403
         
-        lease_req = LeaseRequest.query.get(request_id)
+        lease_req = db.session.get(LeaseRequest, request_id)
         if not lease_req:
-            flash('Booking request not found.')
-            return redirect(url_for('booking_requests'))
+            flash(MSG_BOOKING_NOT_FOUND)
+            return redirect_to('booking_requests')
         
 
         lease_req.status = 'approved'
         
-        # Get or create tenant record for this booking
+        # Get or create tenant record for this booking in one INSERT ... ON CONFLICT round-trip
         tenant_user = lease_req.tenant_user
-        tenant = Tenant.query.filter_by(email=tenant_user.email).first()
-        if not tenant:
-            tenant = Tenant(name=tenant_user.username, email=tenant_user.email, phone=tenant_user.phone)
-            db.session.add(tenant)
-            db.session.flush()
+        tenant_values = dict(name=tenant_user.username, email=tenant_user.email, phone=tenant_user.phone)
+        try:
+            tenant_id = db.session.execute(
+                sqlite_insert(Tenant)
+                .values(**tenant_values)
+                .on_conflict_do_nothing(index_elements=['email'])
+                .returning(Tenant.id)
+            ).scalar()
+        except OperationalError:
+            # uq_tenant_email not created yet (init-db found duplicate emails): there is
+            # no conflict target, so fall back to select-then-insert
+            tenant_id = db.session.execute(
+                select(Tenant.id).where(Tenant.email == tenant_user.email).limit(1)
+            ).scalar()
+            if tenant_id is None:
+                tenant = Tenant(**tenant_values)
+                db.session.add(tenant)
+                db.session.flush()
+                tenant_id = tenant.id
+        if tenant_id is None:
+            tenant_id = db.session.execute(select(Tenant.id).where(Tenant.email == tenant_user.email)).scalar_one()
         
         # Update unit status
         unit = lease_req.unit
@@ -332,16 +698,18 @@ def create_app(test_config=None):
         # Create lease
         lease = Lease(
             unit_id=lease_req.unit_id,
-            tenant_id=tenant.id,
+            tenant_id=tenant_id,
             start_date=lease_req.start_date,
             end_date=lease_req.end_date,
             monthly_rent=0  # Will be set separately
         )
         db.session.add(lease)
         db.session.commit()
+        invalidate_dashboard()
+        invalidate_lists('tenants', 'leases', 'units')
         
         flash(f'✅ Booking request approved! Lease created for Unit {unit.number}.')
-        return redirect(url_for('booking_requests'))
+        return redirect_to('booking_requests')
 
     @app.route('/booking-request/<int:request_id>/reject', methods=['POST'])
     @login_required
@@ -349,16 +717,17 @@ def create_app(test_config=None):
         if not is_admin_user():
             return jsonify({'ok': False, 'message': 'Admin access only'}), 403
         
-        lease_req = LeaseRequest.query.get(request_id)
+        lease_req = db.session.get(LeaseRequest, request_id)
         if not lease_req:
-            flash('Booking request not found.')
-            return redirect(url_for('booking_requests'))
+            flash(MSG_BOOKING_NOT_FOUND)
+            return redirect_to('booking_requests')
         
         lease_req.status = 'rejected'
         db.session.commit()
+        invalidate_dashboard()
         
-        flash(f'❌ Booking request rejected.')
-        return redirect(url_for('booking_requests'))
+        flash(MSG_BOOKING_REJECTED)
+        return redirect_to('booking_requests')
 
     @app.route('/booking-requests/purge-rejected', methods=['POST'])
     @login_required
@@ -367,13 +736,18 @@ def create_app(test_config=None):
         if not is_admin_user():
             return jsonify({'ok': False, 'message': 'Admin access only'}), 403
         try:
-            deleted = LeaseRequest.query.filter(LeaseRequest.status == 'rejected').delete(synchronize_session=False)
+            result = db.session.execute(
+                delete(LeaseRequest).where(LeaseRequest.status == 'rejected'),
+                execution_options={'synchronize_session': False},
+            )
             db.session.commit()
+            deleted = result.rowcount
+            invalidate_dashboard()
             flash(f'✅ Purged {deleted} rejected booking request(s).')
         except Exception:
             db.session.rollback()
-            flash('❌ Error purging rejected requests.', 'error')
-        return redirect(url_for('booking_requests'))
+            flash(MSG_PURGE_FAILED, 'error')
+        return redirect_to('booking_requests')
 
     @app.route('/sdg11')
     def sdg11():
@@ -384,54 +758,64 @@ def create_app(test_config=None):
         """Display available system features and overview."""
         return render_template('features_preview.html')
 
-    @app.route('/dashboard')
-    @login_required
-    def dashboard():
-        """Main dashboard: displays admin management view or tenant apartment browsing based on user role."""
-        is_admin = is_admin_user()
-        
-        # ADMIN DATA
-        units = Unit.query.all()
-        leases = Lease.query.all()
-        tenants = Tenant.query.all()
-        upcoming = [l for l in leases if l.end_date and (l.end_date - datetime.utcnow().date()).days <= 30]
-        
-        # compute lease balances
+    @cache.memoize()
+    def dashboard_payload():
+        """Build the dashboard context as plain values so it can be cached across requests.
+        Invalidated through invalidate_dashboard() by every route that changes units, leases, tenants or payments."""
+        units = Unit.query.options(*strict(joinedload(Unit.property))).all()
+        tenants = Tenant.query.options(*strict()).all()
+        today = datetime.utcnow().date()
+
+        unit_views = {}
+        for u in units:
+            prop = u.property
+            unit_views[u.id] = SimpleNamespace(
+                id=u.id, number=u.number, status=u.status,
+                property=SimpleNamespace(name=prop.name, address=prop.address) if prop else None,
+            )
+        tenant_views = [SimpleNamespace(id=t.id, name=t.name, phone=t.phone, email=t.email) for t in tenants]
+
+        # leases ending within 30 days (or already ended), filtered on the end_date index
+        upcoming = [
+            SimpleNamespace(id=row.id, unit_id=row.unit_id, end_date=row.end_date, unit=unit_views.get(row.unit_id))
+            for row in db.session.execute(
+                select(Lease.id, Lease.unit_id, Lease.end_date)
+                .where(Lease.end_date <= today + timedelta(days=30))
+                .order_by(Lease.id)
+            )
+        ]
+
+        # one aggregated query: each lease with its tenant name and total paid
+        lease_rows = db.session.execute(
+            select(Lease.id, Lease.unit_id, Lease.start_date, Lease.monthly_rent,
+                   Tenant.name.label('tenant_name'),
+                   func.coalesce(func.sum(Payment.amount), 0).label('paid'))
+            .outerjoin(Tenant, Lease.tenant_id == Tenant.id)
+            .outerjoin(Payment, Payment.lease_id == Lease.id)
+            .group_by(Lease.id, Tenant.id)
+            .order_by(Lease.id)
+        ).all()
+
         balances = []
         unit_balances = {}
-        today = datetime.utcnow().date()
-        for l in leases:
-            if not l.start_date:
-                continue
-            months = max(0, (today.year - l.start_date.year) * 12 + (today.month - l.start_date.month))
-            expected = months * (l.monthly_rent or 0)
-            paid = sum(p.amount for p in (l.payments or []))
-            balance = expected - paid
-            balances.append({'lease': l, 'expected': expected, 'paid': paid, 'balance': balance})
-            unit_balances[l.unit_id] = balance
-        
-        # map latest tenant per unit
         unit_tenants = {}
-        for l in leases:
-            try:
-                tenant_name = l.tenant.name if l.tenant else None
-            except Exception:
-                tenant_name = None
-            existing = unit_tenants.get(l.unit_id)
-            if not existing or (hasattr(l, 'id') and l.id and (not hasattr(existing, 'id') or l.id > existing['lease_id'])):
-                unit_tenants[l.unit_id] = {'tenant_name': tenant_name, 'lease_id': getattr(l, 'id', None)}
-        
-        unit_tenants = {k: v['tenant_name'] for k, v in unit_tenants.items()}
-        
-        # map latest rent per unit
-        unit_latest_rent = {}
-        for unit in units:
-            latest_lease = Lease.query.filter_by(unit_id=unit.id).order_by(Lease.id.desc()).first()
-            unit_latest_rent[unit.id] = latest_lease.monthly_rent if latest_lease else 0
+        unit_latest_rent = {unit.id: 0 for unit in units}
+        for row in lease_rows:
+            # rows are in id order, so the latest lease per unit wins
+            unit_tenants[row.unit_id] = row.tenant_name
+            unit_latest_rent[row.unit_id] = row.monthly_rent or 0
+            if not row.start_date:
+                continue
+            months = max(0, (today.year - row.start_date.year) * 12 + (today.month - row.start_date.month))
+            expected = months * (row.monthly_rent or 0)
+            balance = expected - row.paid
+            lease = SimpleNamespace(id=row.id, unit_id=row.unit_id, unit=unit_views.get(row.unit_id))
+            balances.append({'lease': lease, 'expected': expected, 'paid': row.paid, 'balance': balance})
+            unit_balances[row.unit_id] = balance
         
         # TENANT DATA
         available_units = []
-        for unit in units:
+        for unit in unit_views.values():
             if unit.status == 'vacant':
                 monthly_rent = unit_latest_rent.get(unit.id, 0)
                 available_units.append({
@@ -439,29 +823,79 @@ def create_app(test_config=None):
                     'monthly_rent': monthly_rent,
                     'property_name': unit.property.name if unit.property else 'Unknown'
                 })
-        
+
+        return dict(units=list(unit_views.values()),
+                    tenants=tenant_views,
+                    upcoming=upcoming,
+                    balances=balances,
+                    unit_balances=unit_balances,
+                    unit_tenants=unit_tenants,
+                    unit_latest_rent=unit_latest_rent,
+                    available_units=available_units)
+
+    def invalidate_dashboard():
+        cache.delete_memoized(dashboard_payload)
+
+    def invalidate_lists(*tables):
+        """Give each table a fresh version token so cached list pages that read it are skipped."""
+        for table in tables:
+            cache.set(f'list-version:{table}', uuid.uuid4().hex, timeout=0)
+
+    def list_versions(*tables):
+        """Current version tokens for `tables`. The cache may evict a token at any time, so a missing
+        one is replaced by a fresh token rather than read as None, which could key a page cached
+        before the eviction. Returns None if a token still cannot be read back."""
+        keys = [f'list-version:{table}' for table in tables]
+        versions = cache.get_many(*keys)
+        for i, version in enumerate(versions):
+            if version is None:
+                cache.add(keys[i], uuid.uuid4().hex, timeout=0)
+                versions[i] = cache.get(keys[i])
+        return None if None in versions else versions
+
+    def cached_list_page(name, tables, render, *args):
+        """Serve a rendered admin list page from the cache, keyed by the versions of the tables it reads.
+        Pages are rendered fresh while flash messages are pending, since those are per-response."""
+        if session.get('_flashes'):
+            return render()
+        versions = list_versions(*tables)
+        if versions is None:
+            return render()
+        key = ':'.join(['list', name, *versions, *map(str, args)])
+        html = cache.get(key)
+        if html is None:
+            html = render()
+            cache.set(key, html)
+        return html
+
+    @app.route('/dashboard')
+    @login_required
+    def dashboard():
+        """Main dashboard: displays admin management view or tenant apartment browsing based on user role."""
         # Return SAME template for both, with conditional rendering inside
-        return render_template('dashboard.html', 
-                             is_admin=is_admin,
-                             units=units, 
-                             tenants=tenants, 
-                             upcoming=upcoming, 
-                             balances=balances, 
-                             unit_balances=unit_balances, 
-                             unit_tenants=unit_tenants,
-                             unit_latest_rent=unit_latest_rent,
-                             available_units=available_units)
+        return render_template('dashboard.html', is_admin=is_admin_user(), **dashboard_payload())
 
     @app.route('/emergency')
     def emergency_lookup():
         q = request.args.get('q')
         results = []
         if q:
-            results = EmergencyContact.query.filter(
-                (EmergencyContact.unit_identifier.contains(q)) |
-                (EmergencyContact.name.contains(q)) |
-                (EmergencyContact.phone.contains(q))
-            ).all()
+            # an exact unit number is an indexed integer join, no text search needed
+            results = EmergencyContact.query.join(Unit).filter(Unit.number == q).all() or None
+            # trigram FTS needs at least three characters; shorter queries use LIKE
+            if results is None and len(q) >= 3:
+                try:
+                    phrase = '"' + q.replace('"', '""') + '"'
+                    stmt = select(EmergencyContact).from_statement(EMERGENCY_CONTACT_FTS_SEARCH)
+                    results = db.session.execute(stmt, {'q': phrase}).scalars().all()
+                except OperationalError:
+                    db.session.rollback()
+            if results is None:
+                results = EmergencyContact.query.filter(
+                    (EmergencyContact.unit_identifier.contains(q)) |
+                    (EmergencyContact.name.contains(q)) |
+                    (EmergencyContact.phone.contains(q))
+                ).all()
         return render_template('emergency.html', results=results, q=q)
 
     # Tenant Authentication
@@ -475,31 +909,31 @@ def create_app(test_config=None):
             phone = request.form.get('phone')
 
             if not username or not email or not password:
-                flash('Username, email, and password are required.')
-                return redirect(url_for('tenant_signup'))
+                flash(MSG_SIGNUP_FIELDS_REQUIRED)
+                return redirect_to('tenant_signup')
             
             if password != confirm:
-                flash('Passwords do not match.')
-                return redirect(url_for('tenant_signup'))
+                flash(MSG_PASSWORDS_MISMATCH)
+                return redirect_to('tenant_signup')
             
             if len(password) < 6:
-                flash('Password must be at least 6 characters.')
-                return redirect(url_for('tenant_signup'))
+                flash(MSG_PASSWORD_TOO_SHORT)
+                return redirect_to('tenant_signup')
             
             if TenantUser.query.filter_by(username=username).first():
-                flash('Username already exists.')
-                return redirect(url_for('tenant_signup'))
+                flash(MSG_USERNAME_TAKEN)
+                return redirect_to('tenant_signup')
             
             if TenantUser.query.filter_by(email=email).first():
-                flash('Email already registered.')
-                return redirect(url_for('tenant_signup'))
+                flash(MSG_EMAIL_REGISTERED)
+                return redirect_to('tenant_signup')
             
             tenant_user = TenantUser(username=username, email=email, phone=phone)
             tenant_user.set_password(password)
             db.session.add(tenant_user)
             db.session.commit()
-            flash('Account created! Please log in.')
-            return redirect(url_for('tenant_login'))
+            flash(MSG_ACCOUNT_CREATED)
+            return redirect_to('tenant_login')
         
         return render_template('tenant_signup.html')
 
@@ -512,19 +946,19 @@ def create_app(test_config=None):
             
             if tenant and tenant.check_password(password):
                 login_user(tenant)
-                flash('Logged in as tenant.')
+                flash(MSG_TENANT_LOGGED_IN)
                 next_page = request.args.get('next')
                 return redirect(next_page or url_for('dashboard'))
             
-            flash('Invalid credentials.')
+            flash(MSG_INVALID_CREDENTIALS)
         
         return render_template('tenant_login.html')
 
     @app.route('/tenant-logout')
     def tenant_logout():
         logout_user()
-        flash('Logged out.')
-        return redirect(url_for('index'))
+        flash(MSG_LOGGED_OUT)
+        return redirect_to('index')
 
 
 
@@ -539,12 +973,14 @@ def create_app(test_config=None):
         pw = data.get('password') if data else None
         if not pw:
             return jsonify({'ok': False, 'message': 'Password required.'}), 400
-        if pw == 'admin1234':
-            admin = User.query.filter_by(username='admin').first()
-            if admin:
-                login_user(admin)
-                return jsonify({'ok': True, 'redirect': url_for('dashboard')})
-            return jsonify({'ok': False, 'message': 'Admin user not found.'}), 404
+        admin = User.query.filter_by(username='admin').first()
+        if admin is None:
+            # verify against a throwaway account so a missing admin row costs, and answers, the same
+            # as a wrong password; callers cannot probe for the account by status or timing
+            User(username='admin', password_hash=dummy_password_hash()).check_password(pw)
+        elif admin.check_password(pw):
+            login_user(admin)
+            return jsonify({'ok': True, 'redirect': url_for('dashboard')})
         return jsonify({'ok': False, 'message': 'Incorrect password.'}), 401
 
     @app.route('/book-unit', methods=['POST'])
@@ -578,7 +1014,7 @@ def create_app(test_config=None):
             return jsonify({'ok': False, 'message': 'All fields required'}), 400
         
         # Check if unit exists and is vacant
-        unit = Unit.query.get(unit_id)
+        unit = db.session.get(Unit, unit_id)
         if not unit or unit.status != 'vacant':
             return jsonify({'ok': False, 'message': 'Unit is not available'}), 400
         
@@ -602,8 +1038,9 @@ def create_app(test_config=None):
         )
         db.session.add(lease_req)
         db.session.commit()
+        invalidate_dashboard()
         
-        flash('✅ Booking request submitted! An admin will review your request soon.')
+        flash(MSG_BOOKING_SUBMITTED)
         return jsonify({'ok': True, 'message': 'Booking request created successfully', 'redirect': url_for('dashboard')})
 
     # Authentication
@@ -615,17 +1052,17 @@ def create_app(test_config=None):
             user = User.query.filter_by(username=username).first()
             if user and user.check_password(password):
                 login_user(user)
-                flash('Logged in.')
+                flash(MSG_LOGGED_IN)
                 next_page = request.args.get('next')
                 return redirect(next_page or url_for('dashboard'))
-            flash('Invalid credentials.')
+            flash(MSG_INVALID_CREDENTIALS)
         return render_template('login.html')
 
     @app.route('/logout')
     def logout():
         logout_user()
-        flash('Logged out.')
-        return redirect(url_for('index'))
+        flash(MSG_LOGGED_OUT)
+        return redirect_to('index')
 
     @app.route('/change-password', methods=['GET', 'POST'])
     def change_password():
@@ -634,31 +1071,28 @@ def create_app(test_config=None):
             new = request.form.get('new_password')
             confirm = request.form.get('confirm_password')
             if not current_user.check_password(current):
-                flash('Current password is incorrect.')
-                return redirect(url_for('change_password'))
+                flash(MSG_CURRENT_PASSWORD_WRONG)
+                return redirect_to('change_password')
             if new != confirm:
-                flash('New passwords do not match.')
-                return redirect(url_for('change_password'))
+                flash(MSG_NEW_PASSWORDS_MISMATCH)
+                return redirect_to('change_password')
             if len(new) < 6:
-                flash('New password must be at least 6 characters.')
-                return redirect(url_for('change_password'))
-            u = User.query.get(current_user.id)
+                flash(MSG_NEW_PASSWORD_TOO_SHORT)
+                return redirect_to('change_password')
+            u = db.session.get(current_user.__class__, current_user.id)
             u.set_password(new)
             db.session.commit()
-            flash('Password changed successfully.')
-            return redirect(url_for('dashboard'))
+            flash(MSG_PASSWORD_CHANGED)
+            return redirect_to('dashboard')
         return render_template('change_password.html')
 
     # Maintenance
     @app.route('/maintenance')
-    @login_required
+    @admin_required
     def maintenance_list():
-        if not is_admin_user():
-            flash('❌ Admin access only.', 'error')
-            return redirect(url_for('dashboard'))
         reqs = MaintenanceRequest.query.order_by(MaintenanceRequest.created_at.desc()).all()
         # Build a simple map of unit id -> Unit for display purposes
-        units = Unit.query.all()
+        units = Unit.query.options(*strict()).all()
         unit_map = {u.id: u for u in units}
         return render_template('maintenance.html', reqs=reqs, unit_map=unit_map)
 
@@ -670,32 +1104,29 @@ def create_app(test_config=None):
             mr = MaintenanceRequest(unit_id=unit_id, description=desc)
             db.session.add(mr)
             db.session.commit()
-            flash('Maintenance request created.')
-            return redirect(url_for('maintenance_list'))
+            flash(MSG_MAINTENANCE_CREATED)
+            return redirect_to('maintenance_list')
         return render_template('maintenance_form.html', req=None)
 
     @app.route('/maintenance/<int:mid>/edit', methods=['GET', 'POST'])
     def maintenance_edit(mid):
-        req = MaintenanceRequest.query.get_or_404(mid)
+        req = db.get_or_404(MaintenanceRequest, mid)
         if request.method == 'POST':
             req.description = request.form.get('description')
             req.status = request.form.get('status')
             db.session.commit()
-            flash('Maintenance request updated.')
-            return redirect(url_for('maintenance_list'))
+            flash(MSG_MAINTENANCE_UPDATED)
+            return redirect_to('maintenance_list')
         return render_template('maintenance_form.html', req=req)
 
     @app.route('/maintenance/<int:mid>/delete', methods=['POST'])
-    @login_required
+    @admin_required
     def maintenance_delete(mid):
-        if current_user.__class__.__name__ != 'User':
-            flash('❌ Admin access only. You cannot delete maintenance requests.', 'error')
-            return redirect(url_for('dashboard'))
-        req = MaintenanceRequest.query.get_or_404(mid)
+        req = db.get_or_404(MaintenanceRequest, mid)
         db.session.delete(req)
         db.session.commit()
-        flash('✅ Maintenance request deleted successfully.')
-        return redirect(url_for('maintenance_list'))
+        flash(MSG_MAINTENANCE_DELETED)
+        return redirect_to('maintenance_list')
 
 
     # Emergency contacts
@@ -710,168 +1141,249 @@ def create_app(test_config=None):
             unit_identifier = request.form.get('unit_identifier')
             name = request.form.get('name')
             phone = request.form.get('phone')
-            ec = EmergencyContact(unit_identifier=unit_identifier, name=name, phone=phone)
+            ec = EmergencyContact(unit_id=unit_id_for(unit_identifier), unit_identifier=unit_identifier,
+                                  name=name, phone=phone)
             db.session.add(ec)
             db.session.commit()
-            flash('Emergency contact added.')
-            return redirect(url_for('emergency_contacts_list'))
+            flash(MSG_CONTACT_ADDED)
+            return redirect_to('emergency_contacts_list')
         return render_template('emergency_contact_form.html', contact=None)
 
     @app.route('/emergency-contacts/<int:cid>/edit', methods=['GET', 'POST'])
     def emergency_contact_edit(cid):
-        c = EmergencyContact.query.get_or_404(cid)
+        c = db.get_or_404(EmergencyContact, cid)
         if request.method == 'POST':
             c.unit_identifier = request.form.get('unit_identifier')
+            c.unit_id = unit_id_for(c.unit_identifier)
             c.name = request.form.get('name')
             c.phone = request.form.get('phone')
             db.session.commit()
-            flash('Emergency contact updated.')
-            return redirect(url_for('emergency_contacts_list'))
+            flash(MSG_CONTACT_UPDATED)
+            return redirect_to('emergency_contacts_list')
         return render_template('emergency_contact_form.html', contact=c)
 
     @app.route('/emergency-contacts/<int:cid>/delete', methods=['POST'])
     def emergency_contact_delete(cid):
-        c = EmergencyContact.query.get_or_404(cid)
-        db.session.delete(c)
+        if db.session.execute(delete(EmergencyContact).where(EmergencyContact.id == cid)).rowcount == 0:
+            abort(404)
         db.session.commit()
-        flash('Emergency contact deleted.')
-        return redirect(url_for('emergency_contacts_list'))
+        flash(MSG_CONTACT_DELETED)
+        return redirect_to('emergency_contacts_list')
 
     # Tenants
     @app.route('/tenants')
-    @login_required
+    @admin_required
     def tenants_list():
-        if not is_admin_user():
-            flash('❌ Admin access only.', 'error')
-            return redirect(url_for('dashboard'))
-        tenants = Tenant.query.all()
-        return render_template('tenants.html', tenants=tenants)
+        def render():
+            tenants = Tenant.query.options(*strict()).all()
+            return render_template('tenants.html', tenants=tenants)
+        return cached_list_page('tenants', ('tenants',), render)
 
     @app.route('/tenants/new', methods=['GET', 'POST'])
     def tenant_create():
         if request.method == 'POST':
             name = request.form['name']
             phone = request.form.get('phone')
-            email = request.form.get('email')
+            email = request.form.get('email') or None
             t = Tenant(name=name, phone=phone, email=email)
             db.session.add(t)
-            db.session.commit()
-            flash('Tenant created.')
-            return redirect(url_for('tenants_list'))
+            try:
+                db.session.commit()
+            except IntegrityError:
+                db.session.rollback()
+                flash(MSG_TENANT_EMAIL_TAKEN)
+                return render_template('tenant_form.html', tenant=None)
+            invalidate_dashboard()
+            invalidate_lists('tenants')
+            flash(MSG_TENANT_CREATED)
+            return redirect_to('tenants_list')
         return render_template('tenant_form.html', tenant=None)
 
     @app.route('/tenants/<int:tid>/edit', methods=['GET', 'POST'])
     def tenant_edit(tid):
-        tenant = Tenant.query.get_or_404(tid)
+        tenant = db.get_or_404(Tenant, tid)
         if request.method == 'POST':
             tenant.name = request.form['name']
             tenant.phone = request.form.get('phone')
-            tenant.email = request.form.get('email')
-            db.session.commit()
-            flash('Tenant updated.')
-            return redirect(url_for('tenants_list'))
+            tenant.email = request.form.get('email') or None
+            try:
+                db.session.commit()
+            except IntegrityError:
+                db.session.rollback()
+                flash(MSG_TENANT_EMAIL_TAKEN)
+                return redirect(url_for('tenant_edit', tid=tid))
+            invalidate_dashboard()
+            invalidate_lists('tenants', 'leases')
+            flash(MSG_TENANT_UPDATED)
+            return redirect_to('tenants_list')
         return render_template('tenant_form.html', tenant=tenant)
 
     @app.route('/tenants/<int:tid>/delete', methods=['POST'])
-    @login_required
+    @admin_required
     def tenant_delete(tid):
-        if current_user.__class__.__name__ != 'User':
-            flash('❌ Admin access only. You cannot delete tenants.', 'error')
-            return redirect(url_for('dashboard'))
-        tenant = Tenant.query.get_or_404(tid)
-        db.session.delete(tenant)
+        # detach leases first, as the ORM cascade would, then delete without loading the row
+        db.session.execute(update(Lease).where(Lease.tenant_id == tid).values(tenant_id=None))
+        if db.session.execute(delete(Tenant).where(Tenant.id == tid)).rowcount == 0:
+            db.session.rollback()
+            abort(404)
         db.session.commit()
-        flash('✅ Tenant deleted successfully.')
-        return redirect(url_for('tenants_list'))
+        invalidate_dashboard()
+        invalidate_lists('tenants', 'leases')
+        flash(MSG_TENANT_DELETED)
+        return redirect_to('tenants_list')
 
     # Leases
     @app.route('/leases')
-    @login_required
+    @admin_required
     def leases_list():
-        if current_user.__class__.__name__ != 'User':
-            flash('❌ Admin access only.', 'error')
-            return redirect(url_for('dashboard'))
-        leases = Lease.query.all()
-        return render_template('leases.html', leases=leases)
+        def render():
+            leases = Lease.query.options(*strict(joinedload(Lease.unit), joinedload(Lease.tenant))).all()
+            return render_template('leases.html', leases=leases)
+        return cached_list_page('leases', ('leases', 'tenants'), render)
+
+    def lease_form_choices():
+        """Unit and tenant rows for the lease form dropdowns, cached until a unit or tenant write
+        bumps its list version. Only the rendered columns are selected, with no ORM objects built."""
+        versions = list_versions('units', 'tenants')
+        key = ':'.join(['lease-form-choices', *versions]) if versions else None
+        choices = cache.get(key) if key else None
+        if choices is None:
+            units = db.session.execute(select(Unit.id, Unit.number, Unit.status).order_by(Unit.id))
+            tenants = db.session.execute(select(Tenant.id, Tenant.name).order_by(Tenant.id))
+            choices = ([SimpleNamespace(**row._mapping) for row in units],
+                       [SimpleNamespace(**row._mapping) for row in tenants])
+            if key:
+                cache.set(key, choices)
+        return choices
 
     @app.route('/leases/new', methods=['GET', 'POST'])
     def lease_create():
-        units = Unit.query.all()
-        tenants = Tenant.query.all()
+        status = 200
         if request.method == 'POST':
-            unit_id = request.form['unit_id']
-            tenant_id = request.form['tenant_id']
-            start_date = request.form.get('start_date') or None
-            end_date = request.form.get('end_date') or None
-            monthly_rent = request.form.get('monthly_rent') or 0
-            lease = Lease(unit_id=unit_id, tenant_id=tenant_id,
-                          start_date=start_date, end_date=end_date,
-                          monthly_rent=float(monthly_rent))
-            db.session.add(lease)
-            # mark unit occupied
-            u = Unit.query.get(unit_id)
-            if u:
-                u.status = 'occupied'
-            db.session.commit()
-            flash('Lease created.')
-            return redirect(url_for('leases_list'))
-        return render_template('lease_form.html', units=units, tenants=tenants, lease=None)
+            try:
+                data = LeaseIn.model_validate(request.form.to_dict())
+            except ValidationError:
+                flash(MSG_INVALID_LEASE)
+                status = 422
+            else:
+                lease = Lease(unit_id=data.unit_id, tenant_id=data.tenant_id,
+                              start_date=data.start_date, end_date=data.end_date,
+                              monthly_rent=float(data.monthly_rent))
+                db.session.add(lease)
+                # mark unit occupied without loading it
+                db.session.execute(update(Unit).where(Unit.id == data.unit_id).values(status='occupied'))
+                db.session.commit()
+                invalidate_dashboard()
+                invalidate_lists('leases', 'units')
+                flash(MSG_LEASE_CREATED)
+                return redirect_to('leases_list')
+        units, tenants = lease_form_choices()
+        return render_template('lease_form.html', units=units, tenants=tenants, lease=None), status
 
     @app.route('/leases/<int:lid>/edit', methods=['GET', 'POST'])
     def lease_edit(lid):
-        lease = Lease.query.get_or_404(lid)
-        units = Unit.query.all()
-        tenants = Tenant.query.all()
+        lease = db.get_or_404(Lease, lid)
+        status = 200
         if request.method == 'POST':
-            lease.unit_id = request.form['unit_id']
-            lease.tenant_id = request.form['tenant_id']
-            lease.start_date = request.form.get('start_date') or None
-            lease.end_date = request.form.get('end_date') or None
-            lease.monthly_rent = float(request.form.get('monthly_rent') or 0)
-            db.session.commit()
-            flash('Lease updated.')
-            return redirect(url_for('leases_list'))
-        return render_template('lease_form.html', units=units, tenants=tenants, lease=lease)
+            try:
+                data = LeaseIn.model_validate(request.form.to_dict())
+            except ValidationError:
+                flash(MSG_INVALID_LEASE)
+                status = 422
+            else:
+                lease.unit_id = data.unit_id
+                lease.tenant_id = data.tenant_id
+                lease.start_date = data.start_date
+                lease.end_date = data.end_date
+                lease.monthly_rent = float(data.monthly_rent)
+                db.session.commit()
+                invalidate_dashboard()
+                invalidate_lists('leases')
+                flash(MSG_LEASE_UPDATED)
+                return redirect_to('leases_list')
+        units, tenants = lease_form_choices()
+        return render_template('lease_form.html', units=units, tenants=tenants, lease=lease), status
 
     @app.route('/leases/<int:lid>/delete', methods=['POST'])
-    @login_required
+    @admin_required
     def lease_delete(lid):
-        if current_user.__class__.__name__ != 'User':
-            flash('❌ Admin access only. You cannot delete leases.', 'error')
-            return redirect(url_for('dashboard'))
-        lease = Lease.query.get_or_404(lid)
-        # mark unit vacant
-        u = Unit.query.get(lease.unit_id)
-        if u:
-            u.status = 'vacant'
-        db.session.delete(lease)
+        # detach payments, then DELETE ... RETURNING hands back the unit to mark vacant
+        db.session.execute(update(Payment).where(Payment.lease_id == lid).values(lease_id=None))
+        row = db.session.execute(delete(Lease).where(Lease.id == lid).returning(Lease.unit_id)).first()
+        if row is None:
+            db.session.rollback()
+            abort(404)
+        db.session.execute(update(Unit).where(Unit.id == row.unit_id).values(status='vacant'))
         db.session.commit()
-        flash('✅ Lease deleted.')
-        return redirect(url_for('leases_list'))
+        invalidate_dashboard()
+        invalidate_lists('leases', 'payments', 'units')
+        flash(MSG_LEASE_DELETED)
+        return redirect_to('leases_list')
 
     # Payments
     @app.route('/payments')
-    @login_required
+    @admin_required
     def payments_list():
-        if current_user.__class__.__name__ != 'User':
-            flash('❌ Admin access only.', 'error')
-            return redirect(url_for('dashboard'))
-        payments = Payment.query.order_by(Payment.date.desc()).all()
-        return render_template('payments.html', payments=payments)
+        page = request.args.get('page', 1, type=int)
+
+        def render():
+            # plain rows straight off ix_payments_date_desc; no entities to hydrate
+            pagination = (db.session.query(Payment.id, Payment.lease_id, Payment.amount, Payment.date)
+                          .order_by(Payment.date.desc(), Payment.id.desc())
+                          .paginate(page=page, per_page=PAYMENTS_PAGE_SIZE, error_out=False))
+            return render_template('payments.html', payments=pagination.items, pagination=pagination)
+        return cached_list_page('payments', ('payments',), render, page)
 
     @app.route('/payments/new', methods=['GET', 'POST'])
     def payment_create():
-        leases = Lease.query.all()
+        leases = Lease.query.options(*strict(joinedload(Lease.unit), joinedload(Lease.tenant))).all()
+        status = 200
         if request.method == 'POST':
-            lease_id = request.form['lease_id']
-            amount = float(request.form['amount'] or 0)
-            p = Payment(lease_id=lease_id, amount=amount)
-            db.session.add(p)
-            db.session.commit()
-            flash('Payment logged.')
-            return redirect(url_for('payments_list'))
-        return render_template('payment_form.html', leases=leases)
-
+            try:
+                data = PaymentIn.model_validate(request.form.to_dict())
+            except ValidationError:
+                flash(MSG_INVALID_PAYMENT)
+                status = 422
+            else:
+                p = Payment(lease_id=data.lease_id, amount=float(data.amount))
+                db.session.add(p)
+                db.session.commit()
+                invalidate_dashboard()
+                invalidate_lists('payments')
+                flash(MSG_PAYMENT_LOGGED)
+                return redirect_to('payments_list')
+        return render_template('payment_form.html', leases=leases), status
+
+    def create_payments_bulk(rows):
+        """Insert many payments (dicts of lease_id/amount[/date]) as one executemany, bypassing the unit of work."""
+        if not rows:
+            return 0
+        db.session.execute(insert(Payment), rows)
+        db.session.commit()
+        invalidate_dashboard()
+        invalidate_lists('payments')
+        return len(rows)
+
+    @app.cli.command('import-payments')
+    @click.argument('csv_file', type=click.File('r'))
+    def import_payments(csv_file):
+        """Bulk-import payments from a CSV file with lease_id and amount columns.
+        Unlike the payment form, a blank amount is an error rather than a 0.00 payment."""
+        rows = []
+        # line 1 is the header
+        for line, row in enumerate(csv.DictReader(csv_file), start=2):
+            if not (row.get('amount') or '').strip():
+                raise click.ClickException(f'Row {line}: amount is missing.')
+            try:
+                data = PaymentIn.model_validate(row)
+            except ValidationError as e:
+                raise click.ClickException(f'Row {line}: {e}')
+            rows.append({'lease_id': data.lease_id, 'amount': float(data.amount)})
+        print(f'Imported {create_payments_bulk(rows)} payments.')
+
+    adapter = app.url_map.bind('')
+    REDIRECTS.update({rule.endpoint: adapter.build(rule.endpoint)
+                      for rule in app.url_map.iter_rules() if not rule.arguments})
 
     return app
 
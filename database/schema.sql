@@ -18,7 +18,7 @@ CREATE TABLE tenant_user (
     email TEXT NOT NULL UNIQUE,
     password_hash TEXT NOT NULL,
     phone TEXT,
-    created_at DATETIME
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP
 );
 
 CREATE TABLE property (
@@ -34,6 +34,7 @@ CREATE TABLE unit (
     property_id INTEGER,
     FOREIGN KEY(property_id) REFERENCES property(id)
 );
+CREATE INDEX IF NOT EXISTS ix_unit_number ON unit (number);
 
 CREATE TABLE tenant (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -41,6 +42,7 @@ CREATE TABLE tenant (
     phone TEXT,
     email TEXT
 );
+CREATE UNIQUE INDEX IF NOT EXISTS uq_tenant_email ON tenant (email);
 
 CREATE TABLE lease (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -56,22 +58,27 @@ CREATE TABLE lease (
 );
 -- One-to-one link: lease_request -> lease (lease_request_id on lease)
 CREATE UNIQUE INDEX IF NOT EXISTS idx_lease_lease_request_id ON lease (lease_request_id);
+CREATE INDEX IF NOT EXISTS ix_lease_unit_id ON lease (unit_id);
+CREATE INDEX IF NOT EXISTS ix_lease_end_date ON lease (end_date);
 
 CREATE TABLE payment (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     lease_id INTEGER,
     amount REAL NOT NULL,
-    date DATETIME,
+    date DATETIME DEFAULT CURRENT_TIMESTAMP,
     FOREIGN KEY(lease_id) REFERENCES lease(id)
 );
+CREATE INDEX IF NOT EXISTS ix_payments_date_desc ON payment (date DESC, id DESC, lease_id, amount);
 
 CREATE TABLE maintenance_request (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     unit_id INTEGER,
     description TEXT,
     status TEXT DEFAULT 'open',
-    created_at DATETIME
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP
 );
+CREATE INDEX IF NOT EXISTS ix_maintenance_request_status ON maintenance_request (status);
+CREATE INDEX IF NOT EXISTS ix_maintenance_request_created_at ON maintenance_request (created_at);
 
 CREATE TABLE lease_request (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -83,11 +90,13 @@ CREATE TABLE lease_request (
     monthly_rent REAL,
     notes TEXT,
     status TEXT DEFAULT 'pending',
-    created_at DATETIME,
+    created_at DATETIME NOT NULL,
     FOREIGN KEY(unit_id) REFERENCES unit(id),
     FOREIGN KEY(tenant_user_id) REFERENCES tenant_user(id),
     FOREIGN KEY(tenant_id) REFERENCES tenant(id)
 );
+CREATE INDEX IF NOT EXISTS ix_lease_request_created_at ON lease_request (created_at);
+CREATE INDEX IF NOT EXISTS ix_leasereq_status_created ON lease_request (status, created_at);
 -- Optional monthly_rent in request; when approved a Lease is created (may reference this request).
 
 CREATE TABLE emergency_contact (
@@ -98,6 +107,28 @@ CREATE TABLE emergency_contact (
     phone TEXT,
     FOREIGN KEY(unit_id) REFERENCES unit(id)
 );
+CREATE INDEX IF NOT EXISTS ix_emergency_contact_unit_identifier ON emergency_contact (unit_identifier);
+CREATE INDEX IF NOT EXISTS ix_emergency_contact_unit_id ON emergency_contact (unit_id);
+
+-- Trigram full-text index for emergency contact lookup, kept in sync by triggers
+CREATE VIRTUAL TABLE IF NOT EXISTS emergency_contact_fts USING fts5(
+    unit_identifier, name, phone,
+    content='emergency_contact', content_rowid='id', tokenize='trigram'
+);
+CREATE TRIGGER IF NOT EXISTS emergency_contact_ai AFTER INSERT ON emergency_contact BEGIN
+    INSERT INTO emergency_contact_fts(rowid, unit_identifier, name, phone)
+    VALUES (new.id, new.unit_identifier, new.name, new.phone);
+END;
+CREATE TRIGGER IF NOT EXISTS emergency_contact_ad AFTER DELETE ON emergency_contact BEGIN
+    INSERT INTO emergency_contact_fts(emergency_contact_fts, rowid, unit_identifier, name, phone)
+    VALUES ('delete', old.id, old.unit_identifier, old.name, old.phone);
+END;
+CREATE TRIGGER IF NOT EXISTS emergency_contact_au AFTER UPDATE ON emergency_contact BEGIN
+    INSERT INTO emergency_contact_fts(emergency_contact_fts, rowid, unit_identifier, name, phone)
+    VALUES ('delete', old.id, old.unit_identifier, old.name, old.phone);
+    INSERT INTO emergency_contact_fts(rowid, unit_identifier, name, phone)
+    VALUES (new.id, new.unit_identifier, new.name, new.phone);
+END;
 
 COMMIT;
 PRAGMA foreign_keys = ON;
@@ -0,0 +1,27 @@
+import pytest
+
+from app import create_app, db
+
+
+@pytest.fixture(scope='session')
+def app(tmp_path_factory):
+    """App on a seeded SQLite file, with unplanned lazy loads raising.
+    Session-scoped: create_app() defines the models on the shared `db`, so it runs once per process."""
+    app = create_app({
+        'SQLALCHEMY_DATABASE_URI': f"sqlite:///{tmp_path_factory.mktemp('db') / 'test.db'}",
+        'TESTING': True,
+        'RAISELOAD': True,
+    })
+    result = app.test_cli_runner().invoke(args=['init-db'])
+    assert result.exit_code == 0, result.output
+    yield app
+    with app.app_context():
+        db.engine.dispose()
+
+
+@pytest.fixture
+def admin_client(app):
+    client = app.test_client()
+    response = client.post('/admin-autologin', json={'password': 'admin1234'})
+    assert response.status_code == 200
+    return client
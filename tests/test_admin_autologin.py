@@ -0,0 +1,32 @@
+from sqlalchemy import text
+
+import app as app_module
+from app import db
+
+
+def test_missing_admin_answers_like_a_wrong_password(app, monkeypatch):
+    client = app.test_client()
+    verified = []
+    real_verify = app_module.verify_password
+
+    def spy(password_hash, password):
+        verified.append(password_hash)
+        return real_verify(password_hash, password)
+
+    monkeypatch.setattr(app_module, 'verify_password', spy)
+    wrong = client.post('/admin-autologin', json={'password': 'not-it'})
+    with app.app_context():
+        db.session.execute(text("UPDATE user SET username = 'renamed' WHERE username = 'admin'"))
+        db.session.commit()
+    try:
+        missing = client.post('/admin-autologin', json={'password': 'admin1234'})
+    finally:
+        with app.app_context():
+            db.session.execute(text("UPDATE user SET username = 'admin' WHERE username = 'renamed'"))
+            db.session.commit()
+    assert wrong.status_code == missing.status_code == 401
+    assert wrong.get_json() == missing.get_json()
+    # both paths ran an argon2 verify; the missing account against the dummy hash
+    assert len(verified) == 2
+    assert verified[1] == app_module.dummy_password_hash()
+    assert all(h.startswith('$argon2') for h in verified)
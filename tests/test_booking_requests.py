@@ -0,0 +1,82 @@
+import html
+import re
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import insert, text
+
+from app import BOOKING_REQUESTS_PAGE_SIZE, db
+
+TOTAL = BOOKING_REQUESTS_PAGE_SIZE * 2 + 20
+
+
+@pytest.fixture(autouse=True)
+def no_booking_requests(app):
+    with app.app_context():
+        db.session.execute(text('DELETE FROM lease_request'))
+        db.session.commit()
+
+
+def walk_booking_requests(client):
+    """Follow the "Older requests" links from the first page; return every request id shown."""
+    ids, url = [], '/booking-requests'
+    for _ in range(TOTAL):
+        page = client.get(url)
+        assert page.status_code == 200
+        body = page.get_data(as_text=True)
+        ids += [int(i) for i in re.findall(r'/booking-request/(\d+)/approve', body)]
+        link = re.search(r'href="([^"]+)">Older requests', body)
+        if link is None:
+            return ids
+        url = html.unescape(link.group(1))
+    pytest.fail('booking request pages never ended')
+
+
+def seed_requests(app, created_at):
+    with app.app_context():
+        lease_request = db.metadata.tables['lease_request']
+        rows = [{'unit_id': 1, 'tenant_user_id': 1, 'status': 'pending', **created_at(i)} for i in range(TOTAL)]
+        db.session.execute(insert(lease_request), rows)
+        db.session.commit()
+
+
+def test_pages_follow_python_stamped_rows_without_repeats(app, admin_client):
+    seed_requests(app, lambda i: {})
+    ids = walk_booking_requests(admin_client)
+    assert len(ids) == len(set(ids)) == TOTAL
+
+
+@pytest.mark.parametrize('step', [timedelta(0), timedelta(seconds=1)], ids=['same-second', 'distinct-seconds'])
+def test_pages_follow_legacy_current_timestamp_rows_without_repeats(app, admin_client, step):
+    start = datetime(2026, 10, 15, 8, 33, 25)
+    with app.app_context():
+        for i in range(TOTAL):
+            db.session.execute(
+                text("INSERT INTO lease_request (unit_id, tenant_user_id, status, created_at) "
+                     "VALUES (1, 1, 'pending', :ts)"),
+                {'ts': (start + step * i).strftime('%Y-%m-%d %H:%M:%S')})
+        db.session.commit()
+    # init-db normalises the stored CURRENT_TIMESTAMP format of existing rows
+    assert app.test_cli_runner().invoke(args=['init-db']).exit_code == 0
+    ids = walk_booking_requests(admin_client)
+    assert len(ids) == len(set(ids)) == TOTAL
+
+
+def test_pages_include_legacy_rows_without_a_created_at(app, admin_client):
+    # databases created before created_at was NOT NULL may hold unstamped rows
+    with app.app_context():
+        db.session.execute(text('DROP TABLE lease_request'))
+        db.session.execute(text(
+            'CREATE TABLE lease_request (id INTEGER PRIMARY KEY, unit_id INTEGER, tenant_user_id INTEGER, '
+            "start_date DATE, end_date DATE, notes TEXT, status VARCHAR(50) DEFAULT 'pending', created_at DATETIME)"
+        ))
+        for i in range(TOTAL):
+            db.session.execute(
+                text("INSERT INTO lease_request (unit_id, tenant_user_id, status, created_at) "
+                     "VALUES (1, 1, 'pending', :ts)"),
+                {'ts': None if i % 3 else f'2026-10-15 08:{i // 60:02d}:{i % 60:02d}'})
+        db.session.commit()
+    # init-db backfills the NULL stamps and recreates the table's indexes
+    assert app.test_cli_runner().invoke(args=['init-db']).exit_code == 0
+    ids = walk_booking_requests(admin_client)
+    assert len(ids) == len(set(ids)) == TOTAL
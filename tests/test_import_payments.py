@@ -0,0 +1,29 @@
+import pytest
+from sqlalchemy import text
+
+from app import db
+
+
+def payment_count(app):
+    with app.app_context():
+        return db.session.execute(text('SELECT COUNT(*) FROM payment')).scalar()
+
+
+def test_import_payments_inserts_every_row(app, tmp_path):
+    csv_file = tmp_path / 'payments.csv'
+    csv_file.write_text('lease_id,amount\n1,10\n1,20.5\n')
+    before = payment_count(app)
+    result = app.test_cli_runner().invoke(args=['import-payments', str(csv_file)])
+    assert result.exit_code == 0, result.output
+    assert payment_count(app) == before + 2
+
+
+@pytest.mark.parametrize('body', ['1,\n', '1\n', '1,  \n'], ids=['blank', 'missing', 'whitespace'])
+def test_import_payments_rejects_rows_without_an_amount(app, tmp_path, body):
+    csv_file = tmp_path / 'payments.csv'
+    csv_file.write_text('lease_id,amount\n1,10\n' + body)
+    before = payment_count(app)
+    result = app.test_cli_runner().invoke(args=['import-payments', str(csv_file)])
+    assert result.exit_code != 0
+    assert 'Row 3: amount is missing.' in result.output
+    assert payment_count(app) == before
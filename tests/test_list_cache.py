@@ -0,0 +1,21 @@
+from app import cache
+
+
+def evict_version(app, table):
+    """Drop a list version token, as a cache prune or LRU eviction would."""
+    with app.app_context():
+        cache.delete(f'list-version:{table}')
+
+
+def test_write_shows_up_after_version_tokens_are_evicted(app, admin_client):
+    with app.app_context():
+        cache.clear()
+    assert admin_client.get('/tenants').status_code == 200
+    assert admin_client.get('/leases/new').status_code == 200
+
+    admin_client.post('/tenants/1/edit', data={'name': 'Renamed Tenant', 'phone': '', 'email': 'juan@example.com'})
+    admin_client.get('/manage')  # consume the flash so the next views are served from the cache
+    evict_version(app, 'tenants')
+
+    assert 'Renamed Tenant' in admin_client.get('/tenants').get_data(as_text=True)
+    assert 'Renamed Tenant' in admin_client.get('/leases/new').get_data(as_text=True)
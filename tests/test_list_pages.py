@@ -0,0 +1,28 @@
+import pytest
+
+from app import cache
+
+
+@pytest.fixture(autouse=True)
+def uncached_pages(app, admin_client):
+    """Log a payment so every list has rows, and drop cached pages so each view really renders."""
+    admin_client.post('/payments/new', data={'lease_id': '1', 'amount': '100'})
+    with app.app_context():
+        cache.clear()
+
+
+@pytest.mark.parametrize('url', [
+    '/tenants',
+    '/leases',
+    '/payments',
+    '/payments/new',
+    '/leases/new',
+    '/leases/1/edit',
+    '/booking-requests',
+    '/maintenance',
+    '/dashboard',
+])
+def test_admin_pages_render_without_lazy_loads(app, admin_client, url):
+    # the app fixture sets RAISELOAD, so any relationship a view did not load up front raises
+    assert app.config['RAISELOAD']
+    assert admin_client.get(url).status_code == 200
@@ -0,0 +1,43 @@
+from sqlalchemy import inspect, text
+
+from app import db
+
+
+def tenant_indexes(app):
+    with app.app_context():
+        return {index['name'] for index in inspect(db.engine).get_indexes('tenant')}
+
+
+def test_init_db_and_approval_survive_legacy_tenant_emails(app, admin_client):
+    runner = app.test_cli_runner()
+    with app.app_context():
+        db.session.execute(text('DROP INDEX uq_tenant_email'))
+        db.session.execute(text(
+            "INSERT INTO tenant (name, email) VALUES "
+            "('Blank A', ''), ('Blank B', ''), ('Dup C', 'dup@example.com'), ('Dup D', 'dup@example.com')"
+        ))
+        db.session.commit()
+
+    result = runner.invoke(args=['init-db'])
+    assert result.exit_code == 0, result.output
+    assert 'dup@example.com' in result.output
+    assert 'uq_tenant_email' not in tenant_indexes(app)
+    with app.app_context():
+        assert db.session.execute(text("SELECT COUNT(*) FROM tenant WHERE email = ''")).scalar() == 0
+        request_id = db.session.execute(text(
+            "INSERT INTO lease_request (unit_id, tenant_user_id, status, created_at) "
+            "VALUES (2, 1, 'pending', '2026-10-15 08:00:00.000000') RETURNING id"
+        )).scalar()
+        db.session.commit()
+
+    # without the unique index the approval falls back to select-then-insert
+    response = admin_client.post(f'/booking-request/{request_id}/approve')
+    assert response.status_code == 302
+    with app.app_context():
+        assert db.session.execute(
+            text("SELECT COUNT(*) FROM tenant WHERE email = 'tenant@example.com'")).scalar() == 1
+        db.session.execute(text("DELETE FROM tenant WHERE name LIKE 'Dup %' OR name LIKE 'Blank %'"))
+        db.session.commit()
+
+    assert runner.invoke(args=['init-db']).exit_code == 0
+    assert 'uq_tenant_email' in tenant_indexes(app)
@@ -0,0 +1,9 @@
+"""WSGI entry point for production servers, e.g.
+
+    gunicorn -w 1 -k gthread --threads 8 wsgi:application
+
+More than one worker needs a shared CACHE_TYPE; see the README.
+"""
+from app import create_app
+
+application = create_app()